@@ -54,7 +54,9 @@ CREATE TABLE Location (
     country VARCHAR(100) NOT NULL,
     latitude FLOAT NOT NULL,
     longitude FLOAT NOT NULL,
-    timezone VARCHAR(100)
+    timezone VARCHAR(100),
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_location_updated (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 4. User Activity Log
@@ -94,6 +96,8 @@ CREATE TABLE Weather_Station (
     api_id INT,
     installed_date DATE,
     status VARCHAR(50) DEFAULT 'Inactive',
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_station_updated (updated_at),
     CONSTRAINT fk_station_location FOREIGN KEY (location_id) REFERENCES Location(location_id) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_station_api FOREIGN KEY (api_id) REFERENCES API_Integration(api_id) ON DELETE SET NULL ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -108,6 +112,8 @@ CREATE TABLE Weather_Metrics (
     wind_speed FLOAT,
     pressure FLOAT,
     uv_index INT,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_metrics_updated (updated_at),
     CONSTRAINT fk_metrics_station FOREIGN KEY (station_id) REFERENCES Weather_Station(station_id) ON DELETE CASCADE ON UPDATE CASCADE,
     INDEX idx_station_time (station_id, `timestamp`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -135,6 +141,8 @@ CREATE TABLE Forecast (
     low_temp FLOAT,
     weather_condition VARCHAR(100),
     precipitation_chance FLOAT,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_forecast_updated (updated_at),
     CONSTRAINT fk_forecast_location FOREIGN KEY (location_id) REFERENCES Location(location_id) ON DELETE CASCADE ON UPDATE CASCADE,
     UNIQUE KEY ux_location_forecast_date (location_id, forecast_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -149,6 +157,8 @@ CREATE TABLE Alerts (
     location_id INT,
     issue_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     expiry_time DATETIME,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_alerts_updated (updated_at),
     CONSTRAINT fk_alerts_user FOREIGN KEY (raised_by) REFERENCES `User`(user_id) ON DELETE SET NULL ON UPDATE CASCADE,
     CONSTRAINT fk_alerts_location FOREIGN KEY (location_id) REFERENCES Location(location_id) ON DELETE SET NULL ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -162,9 +172,10 @@ CREATE TABLE Notification (
     status VARCHAR(50) DEFAULT 'pending',
     delivery_method VARCHAR(50) DEFAULT 'in-app',
     `string` TEXT,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     CONSTRAINT fk_notification_user FOREIGN KEY (user_id) REFERENCES `User`(user_id) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_notification_alert FOREIGN KEY (alert_id) REFERENCES Alerts(alert_id) ON DELETE CASCADE ON UPDATE CASCADE,
-    INDEX idx_notification_user (user_id)
+    INDEX idx_notification_user (user_id, updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 13. Report